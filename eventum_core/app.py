@@ -1,26 +1,33 @@
 import logging
 import signal
-from multiprocessing import Event, Process, Queue, Value
+import sys
+from multiprocessing import get_context
+from multiprocessing.connection import wait
+from multiprocessing.queues import Queue
 from multiprocessing.sharedctypes import SynchronizedBase
 from multiprocessing.synchronize import Event as EventClass
-from time import sleep
 from typing import NoReturn
 
 import numpy as np
 from eventum_plugins.event.jinja import JinjaEventConfig
 from numpy.typing import NDArray
 from pydantic import BaseModel
-from setproctitle import getproctitle, setproctitle
+from setproctitle import setproctitle
 
 from eventum_core.plugins_connector import (InputConfigMapping,
                                             OutputConfigMapping)
 from eventum_core.settings import DEFAULT_SETTINGS, Settings, TimeMode
-from eventum_core.subprocesses import (start_event_subprocess,
+from eventum_core.subprocesses import (BASE_PROCESS_TITLE,
+                                       start_event_subprocess,
                                        start_input_subprocess,
                                        start_output_subprocess)
 
 logger = logging.getLogger(__name__)
 
+# With "fork" start method subprocesses inherit already loaded config
+# instead of receiving its pickled copy, but it is safe only on Linux
+_mp_context = get_context('fork' if sys.platform == 'linux' else None)
+
 
 class ApplicationConfig(BaseModel, extra='forbid', frozen=True):
     input: tuple[InputConfigMapping, ...]       # type: ignore[valid-type]
@@ -31,7 +38,7 @@ class ApplicationConfig(BaseModel, extra='forbid', frozen=True):
 class Application:
     """Main class of application."""
 
-    _REFRESH_STATUS_INTERVAL = 0.1
+    _SHUTDOWN_TIMEOUT = 1.0
 
     def __init__(
         self,
@@ -45,24 +52,24 @@ class Application:
 
         # For all queues: The None element indicates that no more new
         # elements will be put in that queue
-        self._input_queue: Queue[NDArray[np.datetime64]] = Queue(
+        self._input_queue: Queue[NDArray[np.datetime64]] = _mp_context.Queue(
             maxsize=settings.input_queue_max_size
         )
-        self._event_queue: Queue[NDArray[np.str_]] = Queue(
+        self._event_queue: Queue[NDArray[np.str_]] = _mp_context.Queue(
             maxsize=settings.event_queue_max_size
         )
 
         # Regardless of whether the process ended with an error or not
         # this flag must be set at the end of its execution.
         # Used to control situations when process was killed from outside.
-        self._is_input_done: EventClass = Event()
-        self._is_event_done: EventClass = Event()
-        self._is_output_done: EventClass = Event()
+        self._is_input_done: EventClass = _mp_context.Event()
+        self._is_event_done: EventClass = _mp_context.Event()
+        self._is_output_done: EventClass = _mp_context.Event()
 
-        self._processed_events: SynchronizedBase = Value('Q', 0)
+        self._processed_events: SynchronizedBase = _mp_context.Value('Q', 0)
         self._is_done = False
 
-        self._proc_input = Process(
+        self._proc_input = _mp_context.Process(
             target=start_input_subprocess,
             args=(
                 self._config.input,
@@ -72,7 +79,7 @@ class Application:
                 self._is_input_done
             )
         )
-        self._proc_event = Process(
+        self._proc_event = _mp_context.Process(
             target=start_event_subprocess,
             args=(
                 self._config.event,
@@ -83,7 +90,7 @@ class Application:
                 self._is_event_done
             )
         )
-        self._proc_output = Process(
+        self._proc_output = _mp_context.Process(
             target=start_output_subprocess,
             args=(
                 self._config.output,
@@ -144,9 +151,24 @@ class Application:
 
         self._register_signal_handlers()
 
-        setproctitle(f'{getproctitle()} [main]')
+        setproctitle(f'{BASE_PROCESS_TITLE} [main]')
+
+        # Block on process sentinels instead of polling their state,
+        # each sentinel becomes ready when corresponding process exits
+        running_processes = {
+            proc.sentinel: proc
+            for proc in (self._proc_input, self._proc_event, self._proc_output)
+        }
+
+        while running_processes and not self._is_output_done.is_set():
+            for sentinel in wait(list(running_processes)):
+                # Sentinel is ready before process is reaped, so join
+                # it to make `is_alive()` below reflect the exit
+                proc = running_processes.pop(
+                    sentinel                    # type: ignore[arg-type]
+                )
+                proc.join()
 
-        while not self._is_output_done.is_set():
             if (
                 not self._proc_input.is_alive()
                 and not self._is_input_done.is_set()
@@ -180,15 +202,16 @@ class Application:
                 logger.info('Application shut down')
                 self._terminate_application_on_crash()
 
-            sleep(Application._REFRESH_STATUS_INTERVAL)
+        # Output is done only after receiving the terminating `None`,
+        # so the rest subprocesses are expected to be finishing
+        self._proc_input.join(timeout=Application._SHUTDOWN_TIMEOUT)
+        self._proc_event.join(timeout=Application._SHUTDOWN_TIMEOUT)
 
         if self._proc_input.is_alive() or self._proc_event.is_alive():
             self._terminate_application_on_crash()
-        else:
-            self._proc_input.join()
-            self._proc_event.join()
-            self._proc_output.join()
-            self._is_done = True
+
+        self._proc_output.join()
+        self._is_done = True
 
         logger.info('Application shut down')
         exit(0)
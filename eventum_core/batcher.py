@@ -34,11 +34,14 @@ class Batcher:
         """Target method for thread that tracks conditions."""
         while True:
             with self._lock:
-                self._is_waiting_first_element = True
                 self._is_flushed = False
-                self._is_finished = False
 
-                self._first_element_condition.wait()
+                # Elements can be left in batch after flushing by size
+                # in `add_many` or added while previous batch was being
+                # flushed, so wait for first element only if it's empty
+                if not self._batch and not self._is_finished:
+                    self._is_waiting_first_element = True
+                    self._first_element_condition.wait()
 
                 if self._is_finished:
                     return
@@ -51,11 +54,11 @@ class Batcher:
                 if self._is_flushed:
                     continue
 
-                batch = self._batch
+                # Flush under the lock to keep order of batches flushed
+                # by timeout and by size
+                self._flush_batch(self._batch)
                 self._batch = []
 
-            self._flush_batch(batch)
-
     def _flush_batch(self, batch):
         """Perform callback on current batch."""
         if batch:
@@ -64,13 +67,11 @@ class Batcher:
     def add(self, element: Any) -> None:
         """Add element to current batch."""
 
-        complete_batch = None
-
         with self._lock:
             self._batch.append(element)
 
             if len(self._batch) >= self._size:
-                complete_batch = self._batch
+                self._flush_batch(self._batch)
                 self._batch = []
 
                 self._is_flushed = True
@@ -79,8 +80,37 @@ class Batcher:
                 self._is_waiting_first_element = False
                 self._first_element_condition.notify_all()
 
-        if complete_batch:
-            self._flush_batch(complete_batch)
+    def add_many(self, elements: Iterable[Any]) -> None:
+        """Add multiple elements to current batch."""
+
+        complete_batches = []
+
+        with self._lock:
+            self._batch.extend(elements)
+
+            batch_size = len(self._batch)
+            if batch_size >= self._size:
+                split_index = batch_size - batch_size % self._size
+                complete_elements = self._batch[:split_index]
+                self._batch = self._batch[split_index:]
+
+                complete_batches = [
+                    complete_elements[i:i + self._size]
+                    for i in range(0, split_index, self._size)
+                ]
+
+                if not self._is_waiting_first_element:
+                    self._is_flushed = True
+                    self._size_condition.notify_all()
+
+            # Flush under the lock, otherwise background thread can
+            # flush the remainder by timeout before complete batches
+            for batch in complete_batches:
+                self._flush_batch(batch)
+
+            if self._batch and self._is_waiting_first_element:
+                self._is_waiting_first_element = False
+                self._first_element_condition.notify_all()
 
     def __enter__(self):
         return self
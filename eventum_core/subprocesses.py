@@ -1,13 +1,16 @@
 import asyncio
+import faulthandler
 import logging
 import signal
 import traceback
 from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain
 from multiprocessing import Queue
 from multiprocessing.sharedctypes import SynchronizedBase
 from multiprocessing.synchronize import Event as EventClass
-from typing import Callable, Iterable, NoReturn, Optional
+from queue import Empty
+from typing import Callable, Iterable, Iterator, NoReturn, Optional, Sequence
 
 import numpy as np
 from eventum_plugins.event.base import (EventPluginConfigurationError,
@@ -20,7 +23,6 @@ from eventum_plugins.output.base import (BaseOutputPlugin,
                                          OutputPluginConfigurationError,
                                          OutputPluginRuntimeError)
 from jinja2 import BaseLoader
-from numpy.typing import NDArray
 from pytz import timezone
 from setproctitle import getproctitle, setproctitle
 
@@ -32,13 +34,27 @@ from eventum_core.settings import Settings, TimeMode
 
 logger = logging.getLogger(__name__)
 
+# Title of process at the moment of import, used as a common prefix
+# for titles of main process and all subprocesses
+BASE_PROCESS_TITLE = getproctitle()
+
 
 def subprocess(name: str) -> Callable:
     """Parametrized decorator for all subprocesses."""
 
     def decorator(f: Callable):
         def wrapper(*args, **kwargs):
-            setproctitle(f'{getproctitle()} [{name}]')
+            setproctitle(f'{BASE_PROCESS_TITLE} [{name}]')
+
+            # Dump traceback on fatal errors (e.g. segfault in extension
+            # module) that otherwise are only seen by main process as
+            # unexpected termination of subprocess. It requires stderr
+            # with real file descriptor, so it's skipped when stderr is
+            # replaced (e.g. by application that embeds Eventum)
+            try:
+                faulthandler.enable()
+            except (ValueError, RuntimeError):
+                pass
 
             signal.signal(signal.SIGINT, lambda signal, stack_frame: exit(1))
 
@@ -61,6 +77,52 @@ def _terminate_subprocess(
     exit(exit_code)
 
 
+def _iterate_coalesced_batches(
+    queue: Queue,
+    max_size: int
+) -> Iterator[Sequence[str]]:
+    """Iterate over batches from queue until terminating `None` is
+    received. Batches that are already waiting in queue are merged
+    while total size does not exceed `max_size`, so writes are fewer
+    when consumer falls behind.
+    """
+    carried_batch = None
+    is_incoming_awaited = True
+
+    while is_incoming_awaited:
+        if carried_batch is not None:
+            batch, carried_batch = carried_batch, None
+        else:
+            batch = queue.get()
+
+            if batch is None:
+                return
+
+        pending_batches = [batch]
+        pending_size = len(batch)
+        while pending_size < max_size:
+            try:
+                next_batch = queue.get_nowait()
+            except Empty:
+                break
+
+            if next_batch is None:
+                is_incoming_awaited = False
+                break
+
+            if pending_size + len(next_batch) > max_size:
+                carried_batch = next_batch
+                break
+
+            pending_batches.append(next_batch)
+            pending_size += len(next_batch)
+
+        if len(pending_batches) > 1:
+            yield list(chain.from_iterable(pending_batches))
+        else:
+            yield batch
+
+
 @subprocess('input')
 def start_input_subprocess(
     config: Iterable[MutexFieldsModel],
@@ -123,7 +185,9 @@ def start_input_subprocess(
         with Batcher(
             size=settings.events_batch_size,
             timeout=settings.events_batch_timeout,
-            callback=lambda batch: queue.put(np.array(batch))
+            callback=lambda batch: queue.put(
+                np.array(batch, dtype='datetime64')
+            )
         ) as batcher:
             submitted_tasks: list[Future] = []
             for task in plugin_tasks:
@@ -151,11 +215,13 @@ def start_input_subprocess(
                     )
                     all_success = False
 
-            if not all_success:
-                logger.info('Stopping input plugins')
-                _terminate_subprocess(is_done, 0, queue)
-            else:
-                _terminate_subprocess(is_done, 1, queue)
+    # Terminate only after the batcher is exited so that the last
+    # batch is flushed to the queue before the terminating `None`
+    if all_success:
+        logger.info('Stopping input plugins')
+        _terminate_subprocess(is_done, 0, queue)
+    else:
+        _terminate_subprocess(is_done, 1, queue)
 
 
 @subprocess('event')
@@ -187,11 +253,21 @@ def start_event_subprocess(
         tz=timezone(settings.timezone)
     ).strftime('%z')
 
+    exit_code = 0
     with Batcher(
         size=settings.output_batch_size,
         timeout=settings.output_batch_timeout,
-        callback=lambda batch: event_queue.put(batch)
+        callback=event_queue.put
     ) as batcher:
+        # Bind methods once to avoid attribute lookups for every event
+        render = event_plugin.render
+        add_events = batcher.add_many
+
+        # Reuse the same render parameters for all events, only
+        # timestamp is updated for each of them
+        render_params = {settings.timezone_field_name: timezone_as_string}
+        timestamp_field_name = settings.timestamp_field_name
+
         while True:
             timestamps_batch = input_queue.get()
             if timestamps_batch is None:
@@ -199,28 +275,28 @@ def start_event_subprocess(
 
             try:
                 for timestamp in timestamps_batch:
-                    for event in event_plugin.render(
-                        **{
-                            settings.timestamp_field_name: str(timestamp),
-                            settings.timezone_field_name: timezone_as_string
-                        }
-                    ):
-                        batcher.add(event)
+                    render_params[timestamp_field_name] = str(timestamp)
+                    add_events(render(**render_params))
             except EventPluginRuntimeError:
                 logger.error(
                     f'Failed to produce event:\n'
                     f'{traceback.format_exc()}'
                 )
-                _terminate_subprocess(is_done, 1, event_queue)
+                exit_code = 1
+                break
             except Exception:
                 logger.error(
                     f'Unexpected error occurred during producing event:\n'
                     f'{traceback.format_exc()}'
                 )
-                _terminate_subprocess(is_done, 1, event_queue)
+                exit_code = 1
+                break
 
-    logger.info('Stopping event plugin')
-    _terminate_subprocess(is_done, 0, event_queue)
+    # Terminate only after the batcher is exited so that the last
+    # batch is flushed to the queue before the terminating `None`
+    if exit_code == 0:
+        logger.info('Stopping event plugin')
+    _terminate_subprocess(is_done, exit_code, event_queue)
 
 
 @subprocess('output')
@@ -265,7 +341,7 @@ def start_output_subprocess(
 
     async def write_batch(
         plugin: BaseOutputPlugin,
-        events_batch: NDArray[np.str_]
+        events_batch: Sequence[str]
     ) -> None:
         batch_size = len(events_batch)
         try:
@@ -282,12 +358,10 @@ def start_output_subprocess(
             *[plugin.open() for plugin in output_plugins]
         )
 
-        while True:
-            events_batch = queue.get()
-
-            if events_batch is None:
-                break
-
+        for events_batch in _iterate_coalesced_batches(
+            queue=queue,
+            max_size=settings.output_batch_size
+        ):
             await asyncio.gather(
                 *[
                     write_batch(plugin, events_batch)
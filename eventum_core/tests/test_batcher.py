@@ -39,3 +39,50 @@ def test_batcher_ordering():
         flattened_bucket.extend(batch)
 
     flattened_bucket == list(range(100))
+
+
+def test_batcher_add_many_size_condition():
+    bucket = []
+    with Batcher(size=10, timeout=1, callback=bucket.append) as batcher:
+        for i in range(10):
+            batcher.add_many(range(i * 15, (i + 1) * 15))
+
+    assert len(bucket) == 15
+
+    for batch in bucket:
+        assert len(batch) == 10
+
+    flattened_bucket = []
+    for batch in bucket:
+        flattened_bucket.extend(batch)
+
+    assert flattened_bucket == list(range(150))
+
+
+def test_batcher_add_many_timeout_condition():
+    bucket = []
+    with Batcher(size=10, timeout=0.01, callback=bucket.append) as batcher:
+        batcher.add_many(range(15))
+        time.sleep(0.05)
+
+        assert len(bucket) == 2
+
+    assert [len(batch) for batch in bucket] == [10, 5]
+
+
+def test_batcher_add_many_ordering_with_slow_callback():
+    bucket = []
+
+    def slow_callback(batch):
+        time.sleep(0.001)
+        bucket.append(batch)
+
+    with Batcher(size=10, timeout=0.0005, callback=slow_callback) as batcher:
+        for i in range(20):
+            batcher.add_many(range(i * 25, (i + 1) * 25))
+
+    flattened_bucket = []
+    for batch in bucket:
+        flattened_bucket.extend(batch)
+
+    assert flattened_bucket == list(range(500))
@@ -13,7 +13,8 @@ from jinja2 import DictLoader
 from eventum_core.app import TimeMode
 from eventum_core.plugins_connector import InputConfigMapping
 from eventum_core.settings import Settings
-from eventum_core.subprocesses import (start_event_subprocess,
+from eventum_core.subprocesses import (_iterate_coalesced_batches,
+                                       start_event_subprocess,
                                        start_input_subprocess,
                                        start_output_subprocess)
 
@@ -59,6 +60,37 @@ def test_input_subprocess():
     proc_input.join()
 
 
+def test_input_subprocess_flushes_last_batch_before_none():
+    queue = Queue()
+    is_done = Event()
+
+    proc_input = Process(
+        target=start_input_subprocess,
+        args=(
+            [InputConfigMapping(sample=SampleInputConfig(count=10))],
+            Settings(events_batch_size=3, events_batch_timeout=10),
+            TimeMode.SAMPLE,
+            queue,
+            is_done
+        )
+    )
+    proc_input.start()
+
+    elements = []
+    while True:
+        batch = queue.get(timeout=1)
+
+        if batch is None:
+            break
+
+        elements.extend(batch)
+
+    assert len(elements) == 10
+
+    proc_input.join()
+    assert proc_input.exitcode == 0
+
+
 def test_event_subprocess():
     input_queue = Queue()
     event_queue = Queue()
@@ -112,6 +144,62 @@ def test_event_subprocess():
     proc_event.join()
 
 
+def test_event_subprocess_timestamps_format():
+    input_queue = Queue()
+    event_queue = Queue()
+    is_done = Event()
+
+    proc_event = Process(
+        target=start_event_subprocess,
+        args=(
+            JinjaEventConfig(
+                params={},
+                samples={},
+                mode=TemplatePickingMode.ALL,
+                templates={
+                    'test': TemplateConfig(template='test.jinja')
+                }
+            ),
+            DictLoader({'test.jinja': '{{ timestamp }}'}),
+            Settings(timestamp_field_name='timestamp', output_batch_timeout=0),
+            input_queue,
+            event_queue,
+            is_done
+        )
+    )
+
+    timestamps = np.array(
+        [np.datetime64('2024-01-01T00:00:00.123456')] * 10,
+        dtype='datetime64'
+    )
+
+    proc_event.start()
+    input_queue.put(timestamps)
+    input_queue.put(None)
+
+    try:
+        is_done.wait(timeout=1)
+    except TimeoutError:
+        proc_event.terminate()
+        raise AssertionError('Long subprocess execution')
+
+    # IPC sleep
+    time.sleep(0.5)
+
+    events = []
+    while True:
+        batch = event_queue.get(timeout=0.1)
+
+        if batch is None:
+            break
+
+        events.extend(batch)
+
+    assert events == [str(timestamp) for timestamp in timestamps]
+
+    proc_event.join()
+
+
 def test_output_subprocess():
     event_queue = Queue()
     processed_event = Value('Q', 0)
@@ -144,3 +232,91 @@ def test_output_subprocess():
     assert processed_event.value == 10
 
     proc_output.join()
+
+
+def test_event_subprocess_flushes_last_batch_before_none_on_error():
+    input_queue = Queue()
+    event_queue = Queue()
+    is_done = Event()
+
+    proc_event = Process(
+        target=start_event_subprocess,
+        args=(
+            JinjaEventConfig(
+                params={},
+                samples={},
+                mode=TemplatePickingMode.ALL,
+                templates={
+                    'test': TemplateConfig(template='test.jinja')
+                }
+            ),
+            DictLoader(
+                {
+                    'test.jinja': (
+                        "{% if timestamp == 'bad' %}{{ 1 / 0 }}{% endif %}"
+                        '{{ timestamp }}'
+                    )
+                }
+            ),
+            Settings(
+                timestamp_field_name='timestamp',
+                output_batch_size=3,
+                output_batch_timeout=10
+            ),
+            input_queue,
+            event_queue,
+            is_done
+        )
+    )
+
+    proc_event.start()
+    input_queue.put(np.array(['ok'] * 5))
+    input_queue.put(np.array(['bad']))
+
+    events = []
+    while True:
+        batch = event_queue.get(timeout=1)
+
+        if batch is None:
+            break
+
+        events.extend(batch)
+
+    assert events == ['ok'] * 5
+
+    proc_event.join()
+    assert proc_event.exitcode == 1
+
+
+def test_iterate_coalesced_batches_size_limit():
+    queue = Queue()
+    for i in range(5):
+        queue.put(list(range(i * 3, (i + 1) * 3)))
+    queue.put(None)
+
+    # IPC sleep
+    time.sleep(0.1)
+
+    batches = list(_iterate_coalesced_batches(queue=queue, max_size=7))
+
+    assert [len(batch) for batch in batches] == [6, 6, 3]
+
+    flattened_batches = []
+    for batch in batches:
+        flattened_batches.extend(batch)
+
+    assert flattened_batches == list(range(15))
+
+
+def test_iterate_coalesced_batches_stops_on_none_while_draining():
+    queue = Queue()
+    queue.put(['a', 'b'])
+    queue.put(['c', 'd'])
+    queue.put(None)
+
+    # IPC sleep
+    time.sleep(0.1)
+
+    batches = list(_iterate_coalesced_batches(queue=queue, max_size=10))
+
+    assert batches == [['a', 'b', 'c', 'd']]